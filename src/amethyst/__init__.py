@@ -1,25 +1,68 @@
-from amethyst.amethyst import BaseWidget, Client, Plugin, WidgetPlugin
-from amethyst.widget.command import CommandWidget, command
-from amethyst.widget.event import Event, EventWidget, event
-from amethyst.widget.event.library import *  # noqa: F403
-from amethyst.widget.menu import ContextMenuWidget, context_menu
-from amethyst.widget.schedule import ScheduleWidget, schedule
+import importlib
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from amethyst.amethyst import BaseWidget, Client, Plugin, WidgetPlugin
+    from amethyst.widget.command import CommandWidget, command
+    from amethyst.widget.event import Event, EventWidget, event
+    from amethyst.widget.event.library import *
+    from amethyst.widget.menu import ContextMenuWidget, context_menu
+    from amethyst.widget.schedule import ScheduleWidget, schedule
 
 __version__ = "${pyproject.tool.poetry.version}"
 __author__ = "${pyproject.tool.poetry.authors.0}"
 
 __all__ = (
+    "BaseWidget",
+    "Client",
     "CommandWidget",
-    "EventWidget",
     "ContextMenuWidget",
+    "Event",
+    "EventWidget",
+    "Plugin",
     "ScheduleWidget",
     "WidgetPlugin",
-    "BaseWidget",
     "command",
-    "Client",
-    "Plugin",
-    "Event",
+    "context_menu",
     "event",
     "schedule",
-    "context_menu",
 )
+
+# Exports are resolved on first access so that `import amethyst` does not pay for
+# importing discord.py until something from the package is actually used.
+_exports = {
+    "BaseWidget": "amethyst.amethyst",
+    "Client": "amethyst.amethyst",
+    "Plugin": "amethyst.amethyst",
+    "WidgetPlugin": "amethyst.amethyst",
+    "CommandWidget": "amethyst.widget.command",
+    "command": "amethyst.widget.command",
+    "Event": "amethyst.widget.event",
+    "EventWidget": "amethyst.widget.event",
+    "event": "amethyst.widget.event",
+    "ContextMenuWidget": "amethyst.widget.menu",
+    "context_menu": "amethyst.widget.menu",
+    "ScheduleWidget": "amethyst.widget.schedule",
+    "schedule": "amethyst.widget.schedule",
+}
+_submodules = ("amethyst", "error", "util", "widget")
+_library = "amethyst.widget.event.library"
+
+
+def __getattr__(name: str) -> Any:
+    if name in _exports:
+        value = getattr(importlib.import_module(_exports[name]), name)
+    elif name in _submodules:
+        value = importlib.import_module(f"{__name__}.{name}")
+    elif name.startswith("on_") and name in importlib.import_module(_library).__all__:
+        value = getattr(importlib.import_module(_library), name)
+    else:
+        raise AttributeError(f"module '{__name__}' has no attribute '{name}'")
+
+    globals()[name] = value  # skip this hook on subsequent lookups
+    return value
+
+
+def __dir__() -> list[str]:
+    library = importlib.import_module(_library)
+    return sorted({*globals(), *_exports, *_submodules, *library.__all__})
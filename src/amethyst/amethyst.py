@@ -2,33 +2,30 @@ from __future__ import annotations
 
 import asyncio
 import contextlib
+import functools
 import logging
+from collections.abc import Callable, Coroutine, Sequence
 from typing import (
     TYPE_CHECKING,
     Any,
-    Callable,
-    Concatenate,
-    Coroutine,
     ParamSpec,
     Self,
-    Type,
     TypeAlias,
     TypeVar,
 )
 
 import discord
 import dynamicpy
-import environ
-import envnull
-import lavender
 
 from amethyst import error
-from amethyst.util import classproperty, is_dict_subset, safesubclass
+from amethyst.util import is_dict_subset, safesubclass
 
 if TYPE_CHECKING:
+    from typing import Concatenate
+
     from amethyst.widget.event import Event
 
-__all__ = ("Client", "Plugin", "BaseWidget", "WidgetPlugin")
+__all__ = ("BaseWidget", "Client", "Plugin", "WidgetPlugin")
 
 WidgetT = TypeVar("WidgetT", bound="BaseWidget[Any]")
 PluginT = TypeVar("PluginT", bound="Plugin")
@@ -36,12 +33,57 @@ P = ParamSpec("P")
 T = TypeVar("T")
 
 PluginSelf: TypeAlias = "Self@Plugin"  # type: ignore
-CallbackT = TypeVar("CallbackT", bound=Callable[Concatenate[PluginSelf, ...], Any])
+# the bound is only meaningful to type checkers, so avoid building it at runtime
+CallbackT = TypeVar("CallbackT", bound="Callable[Concatenate[PluginSelf, ...], Any]")
 Coro = Coroutine[Any, Any, T]
 
-_default_modules = [".command", ".commands", ".plugins", ".plugin"]
+_default_modules = (".command", ".commands", ".plugins", ".plugin")
+_toplevel_default_modules = tuple(m.removeprefix(".") for m in _default_modules)
 _log = logging.getLogger(__name__)
 
+# USER and MESSAGE commands have an empty string for their description
+# https://discord.com/developers/docs/interactions/application-commands#application-command-object-application-command-structure
+_empty_description_types = frozenset(
+    (discord.AppCommandType.message.value, discord.AppCommandType.user.value)
+)
+
+# Remote command fields that can be compared without serialising the command
+_remote_fields: dict[str, Callable[[discord.app_commands.AppCommand], Any]] = {
+    "name": lambda r: r.name,
+    "type": lambda r: r.type.value,
+    "description": lambda r: r.description,
+    "nsfw": lambda r: r.nsfw,
+    "dm_permission": lambda r: r.dm_permission,
+    "default_member_permissions": lambda r: (
+        None if r.default_member_permissions is None else r.default_member_permissions.value
+    ),
+}
+
+
+@functools.cache
+def _locate_package(module: str) -> str | None:
+    """Return the package containing the specified module, cached by module name."""
+    try:
+        if dynamicpy.is_package(module):
+            package = module
+        else:
+            package = dynamicpy.get_module_parent(module)
+
+        _log.debug("Instantiating package located as '%s'", package)
+        return package
+    except dynamicpy.NoParentError:
+        _log.debug("Instantiating module is top-level.")
+        return None
+
+
+def _is_loadable_plugin(value: type) -> bool:
+    """Return `True` if the type is a plugin to register when found in a module."""
+    return (
+        value is not Plugin
+        and issubclass(value, Plugin)
+        and not issubclass(value, WidgetPlugin)
+    )
+
 
 class Client(discord.Client):
     """Represents a connection to Discord. This class extends discord.Client and is the primary home of amethyt's additions.
@@ -120,6 +162,8 @@ class Client(discord.Client):
         intents: discord.Intents,
         **options: Any,
     ) -> None:
+        import envnull  # loads the .env file, so only import once a client is created
+
         super().__init__(intents=intents, **options)
         self._instantiating_package = self._get_instantiating_package()
         self._setup_hooks: list[Callable[..., Coro[None]]] = []
@@ -127,9 +171,12 @@ class Client(discord.Client):
         self._tree = discord.app_commands.CommandTree(self)
         self._dependencies = dynamicpy.DependencyLibrary()
         self._module_loader = self._build_module_loader()
-        self._plugins: dict[Type[Plugin], Plugin] = {}
+        self._widget_loader = self._build_widget_loader()
+        self._found_widgets: list[BaseWidget] = []
+        self._plugins: dict[type[Plugin], Plugin] = {}
+        self._loaded_modules: set[str] = set()
         self._tasks: list[Coro[Any]] | None = []
-        self._widgets: list[BaseWidget] = []
+        self._widgets: set[BaseWidget] = set()
 
         self._guild = None
         if envnull.AMETHYST_GUILD is not None:
@@ -145,12 +192,12 @@ class Client(discord.Client):
         """The command tree responsible for handling the application commands in this bot."""
         return self._tree
 
-    def has_plugin(self, plugin: Type[Plugin]) -> bool:
+    def has_plugin(self, plugin: type[Plugin]) -> bool:
         """Checks if the specified plugin has been registered with this client.
 
         Parameters
         ----------
-        plugin : `Type[Plugin]`
+        plugin : `type[Plugin]`
             The plugin to check if its been registered.
 
         Returns
@@ -160,12 +207,12 @@ class Client(discord.Client):
         """
         return plugin in self._plugins
 
-    def get_plugin(self, plugin: Type[PluginT]) -> PluginT:
+    def get_plugin(self, plugin: type[PluginT]) -> PluginT:
         """Gets the registered instance of the specified plugin.
 
         Parameters
         ----------
-        plugin : `Type[PluginT]`
+        plugin : `type[PluginT]`
             The plugin to get an instance of.
 
         Returns
@@ -178,31 +225,40 @@ class Client(discord.Client):
         `KeyError`
             Raised if no such plugin has been registered.
         """
-        if plugin in self._plugins:
-            return self._plugins[plugin]  # type: ignore
+        instance = self._plugins.get(plugin)
+        if instance is not None:
+            return instance  # type: ignore
         raise KeyError(f"Plugin {plugin.name} not registered.")
 
-    def load_plugins(self, modules: list[str] = _default_modules) -> None:
+    def load_plugins(self, modules: Sequence[str] = _default_modules) -> None:
         """Load all plugins found in the specified modules and their submodules.
 
         Parameters
         ----------
-        modules : `list[str]`, optional
+        modules : `Sequence[str]`, optional
             The list of modules to recursively search.
         """
+        if self._instantiating_package is None:
+            if modules is _default_modules:
+                modules = _toplevel_default_modules
+            else:
+                modules = [m.removeprefix(".") for m in modules]
+
         _log.debug("Loading modules %s", modules)
         for module in modules:
-            if self._instantiating_package is None and module.startswith("."):
-                module = module[1:]
+            # plugins found in a module have already been registered on later calls
+            if module in self._loaded_modules:
+                continue
             with contextlib.suppress(ImportError):
                 self._module_loader.load_module(module, self._instantiating_package)
+                self._loaded_modules.add(module)
 
-    def register_plugin(self, plugin: Type[Plugin]) -> None:
+    def register_plugin(self, plugin: type[Plugin]) -> None:
         """Register the specified plugin and all its widgets.
 
         Parameters
         ----------
-        plugin : `Type[Plugin]`
+        plugin : `type[Plugin]`
             The plugin to register.
 
         Raises
@@ -217,25 +273,16 @@ class Client(discord.Client):
         _log.debug("Registering plugin '%s'", plugin.name)
 
         # * Instantiate Plugin
-        try:
-            instance = plugin.__new__(plugin)
-            setattr(instance, "_client", self)
-            self._dependencies.inject(instance.__init__)
-        except (dynamicpy.DependencyNotFoundError, dynamicpy.InjectDependenciesError) as e:
-            raise error.PluginDependencyError(
-                f"Error injecting dependencies into '{plugin.name}'"
-            ) from e
+        instance = self._instantiate_plugin(plugin)
 
         # * Load widgets
-        loader = dynamicpy.DynamicLoader()
-
-        @loader.widget_handler(BaseWidget)
-        def _(widget: BaseWidget):
+        # collect first, as registering a widget may register its widget plugin
+        found = self._found_widgets = []
+        self._widget_loader.load_object(instance)
+        for widget in found:
             if widget not in self._widgets:
                 widget.register(instance, self)
-                self._widgets.append(widget)
-
-        loader.load_object(instance)
+                self._widgets.add(widget)
 
         # * Add to plugins list
         self._plugins[plugin] = instance
@@ -261,12 +308,12 @@ class Client(discord.Client):
 
     async def wait_for(
         self,
-        event: "Event[P]",
+        event: Event[P],
         /,
         *,
         check: Callable[P, bool] | None = None,
         timeout: float | None = None,
-    ) -> None:
+    ) -> Any:
         """
         Waits for a WebSocket event to be dispatched.
 
@@ -296,11 +343,18 @@ class Client(discord.Client):
             parameters of the event being waited for.
         timeout : `float | None`, optional
             The number of seconds to wait before timing out and raising `asyncio.TimeoutError`.
+
+        Returns
+        -------
+        `Any`
+            The arguments of the event that met the requirements.
         """
-        await super().wait_for(event.name, check=check, timeout=timeout)
+        # discord.py creates its future eagerly, so keep this a coroutine to allow waiting
+        # to be scheduled before the event loop has started
+        return await super().wait_for(event.name, check=check, timeout=timeout)
 
     def event(
-        self, event: "Event[P]"
+        self, event: Event[P]
     ) -> Callable[[Callable[P, Coro[None]]], Callable[P, Coro[None]]]:
         """A decorator that registers an event to listen to.
 
@@ -350,35 +404,31 @@ class Client(discord.Client):
         if len(remotes) != len(locals):
             return True
 
+        # renamed or replaced commands are caught without serialising anything
+        if {c.name for c in locals} != {r.name for r in remotes}:
+            return True
+
+        remote_index = {(r.name, r.type.value): r for r in remotes}
         for local in locals:
             subset = local.to_dict()
-            remote = discord.utils.get(
-                remotes,
-                name=local.name,
-                type=discord.AppCommandType(subset["type"]),
-            )
+            remote = remote_index.get((local.name, subset["type"]))
 
             if remote is None:
                 return True
 
-            superset = {
-                "default_member_permissions": None
-                if remote.default_member_permissions is None
-                else remote.default_member_permissions.value,
-                "dm_permission": remote.dm_permission,
-                "nsfw": remote.nsfw,
-                **remote.to_dict(),
-            }
-
-            # USER and MESSAGE commands have an empty string for their description
-            # https://discord.com/developers/docs/interactions/application-commands#application-command-object-application-command-structure
-            if subset["type"] in (
-                discord.AppCommandType.message,
-                discord.AppCommandType.user,
-            ):
+            if subset["type"] in _empty_description_types:
                 subset["description"] = ""
 
-            if not is_dict_subset(superset, subset):
+            # compare flat fields directly and only serialise the remote for the rest
+            remaining = {}
+            for key, value in subset.items():
+                field = _remote_fields.get(key)
+                if field is None:
+                    remaining[key] = value
+                elif field(remote) != value:
+                    return True
+
+            if remaining and not is_dict_subset(remote.to_dict(), remaining):
                 return True
 
         return False
@@ -410,13 +460,17 @@ class Client(discord.Client):
         bool
             `True` if guild is allowed.
         """
-        if self.allowed_guild is None:
+        allowed = self._guild
+        if allowed is None:
             return True
 
+        # ids are the common case, so avoid the isinstance checks for plain ints
+        if type(check) is int:
+            return check == allowed
         if isinstance(check, discord.Guild):
-            return check.id == self.allowed_guild
+            return check.id == allowed
         if isinstance(check, int):
-            return check == self.allowed_guild
+            return check == allowed
         return False
 
     def run(
@@ -427,8 +481,8 @@ class Client(discord.Client):
         token: str | None = None,
         log_level: int = logging.INFO,
         auto_sync: bool | None = None,
-        log_filters: dict[str, int] = {},
-        plugin_modules: list[str] = _default_modules,
+        log_filters: dict[str, int] | None = None,
+        plugin_modules: Sequence[str] = _default_modules,
     ) -> None:
         """A blocking call that abstracts away the event loop
         initialisation from you.
@@ -448,9 +502,9 @@ class Client(discord.Client):
             Overrides the `AMETHYST_AUTO_SYNC` environment variable. If `True` then the application command tree will be refreshed automatically.
         log_level : `int`, optional
             The default log level for Lavender's logger.
-        log_filters : `dict[str, int]`, optional
+        log_filters : `dict[str, int] | None`, optional
             Initial logging filter patterns, by default no specific filters are specified.
-        plugin_modules : `list[str]`, optional
+        plugin_modules : `Sequence[str]`, optional
             A list of modules to recursively search of plugins.
         """
         if guild != -1:
@@ -458,10 +512,18 @@ class Client(discord.Client):
         if auto_sync is not None:
             self._auto_sync = auto_sync
 
-        lavender.setup(level=log_level, filter_config=log_filters)
+        import lavender
+
+        lavender.setup(level=log_level, filter_config=log_filters or {})
         self.load_plugins(plugin_modules)
+
+        if not token:
+            import environ  # only read the environment if no token was passed
+
+            token = environ.AMETHYST_TOKEN
+
         return super().run(
-            token or environ.AMETHYST_TOKEN,
+            token,
             reconnect=reconnect,
             log_handler=None,
         )
@@ -482,10 +544,11 @@ class Client(discord.Client):
             await self.refresh_tree(guild)
 
         # Run pending tasks
-        if self._tasks is not None:
-            for task in self._tasks:
-                self.loop.create_task(task)
-            self._tasks = None
+        pending, self._tasks = self._tasks, None
+        if pending:
+            create_task = self.loop.create_task
+            for task in pending:
+                create_task(task)
 
     async def on_ready(self) -> None:
         if self.user is None:
@@ -504,35 +567,45 @@ class Client(discord.Client):
     def _build_module_loader(self) -> dynamicpy.DynamicLoader:
         """Build the `DynamicLoader` used for finding plugins in modules."""
         loader = dynamicpy.DynamicLoader()
+        loader.register_handler(self._plugin_handler)
+        return loader
 
-        @loader.handler()
-        def _(_, value: Any):
-            if (
-                value is not Plugin
-                and safesubclass(value, Plugin)
-                and not issubclass(value, WidgetPlugin)
-            ):
-                with contextlib.suppress(error.DuplicatePluginError):
-                    self.register_plugin(value)
+    def _plugin_handler(self, _, value: Any) -> None:
+        """Register the value with this client if it is a loadable plugin."""
+        if isinstance(value, type) and _is_loadable_plugin(value):
+            with contextlib.suppress(error.DuplicatePluginError):
+                self.register_plugin(value)
 
+    def _build_widget_loader(self) -> dynamicpy.DynamicLoader:
+        """Build the `DynamicLoader` used for finding widgets in plugins."""
+        loader = dynamicpy.DynamicLoader()
+        loader.register_widget_handler(BaseWidget, self._widget_handler)
         return loader
 
-    def _get_instantiating_package(self) -> str | None:
-        """Return the package the application was instantiated from."""
+    def _widget_handler(self, widget: BaseWidget) -> None:
+        """Collect a widget found on the plugin currently being registered."""
+        self._found_widgets.append(widget)
+
+    def _instantiate_plugin(self, plugin: type[PluginT]) -> PluginT:
+        """Create an instance of the plugin bound to this client.
 
+        Dependencies are injected into the plugin's constructor.
+        """
+        instance = plugin.__new__(plugin)
+        instance._client = self
         try:
-            module = dynamicpy.get_foreign_module()
+            self._dependencies.inject(instance.__init__)
+        except (dynamicpy.DependencyNotFoundError, dynamicpy.InjectDependenciesError) as e:
+            raise error.PluginDependencyError(
+                f"Error injecting dependencies into '{plugin.name}'"
+            ) from e
+        return instance
 
-            if dynamicpy.is_package(module):
-                package = module
-            else:
-                package = dynamicpy.get_module_parent(module)
+    def _get_instantiating_package(self) -> str | None:
+        """Return the package the application was instantiated from."""
 
-            _log.debug("Instantiating package located as '%s'", package)
-            return package
-        except dynamicpy.NoParentError:
-            _log.debug("Instantiating module is top-level.")
-            return None
+        try:
+            return _locate_package(dynamicpy.get_foreign_module())
         except ImportError as e:
             raise error.ModuleLocateError("Error locating instantiating package") from e
 
@@ -542,23 +615,50 @@ class Client(discord.Client):
 class Plugin:
     """The base class for all Amethyst plugins to inherit from."""
 
+    __slots__ = ("_client",)
+
+    name: str = "Plugin"
+    """The name of this plugin."""
+
+    _auto_name = True  # False once a class in the hierarchy sets the name explicitly
+
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        super().__init_subclass__(**kwargs)
+        if "name" in vars(cls):
+            cls._auto_name = False
+        elif cls._auto_name:
+            cls.name = cls.__qualname__
+
+    def __new__(cls, *args: Any, **kwargs: Any) -> Self:
+        # a slot cannot have a class-level default, so initialise it here instead
+        self = super().__new__(cls)
+        self._client = None
+        return self
+
     def __init__(self) -> None:
         """The client will attempt to bind constructor parameters to dependencies when registered."""
 
     @property
     def client(self) -> Client:
         """The instance of `Client` this plugin has been registered to."""
-        return getattr(self, "_client") if hasattr(self, "_client") else None  # type: ignore
-
-    @classproperty
-    def name(cls):
-        """The name of this plugin."""
-        return cls.__qualname__
+        return self._client  # type: ignore
 
 
 class BaseWidget(dynamicpy.BaseWidget[CallbackT]):
     """The base class for all Amethyst widgets to inherit from."""
 
+    type: str = "BaseWidget"
+    """The name of the type of widget."""
+
+    _auto_type = True  # False once a class in the hierarchy sets the type explicitly
+
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        super().__init_subclass__(**kwargs)
+        if "type" in vars(cls):
+            cls._auto_type = False
+        elif cls._auto_type:
+            cls.type = cls.__qualname__
+
     def __init__(self, callback: CallbackT) -> None:
         super().__init__(callback)
 
@@ -574,10 +674,20 @@ class BaseWidget(dynamicpy.BaseWidget[CallbackT]):
         """
         raise NotImplementedError(f"{self.type} must implement 'register'")
 
-    @classproperty
-    def type(cls) -> str:
-        """The name of the type of widget."""
-        return cls.__qualname__
+    def bound(self, plugin: Plugin) -> Callable[..., Any]:
+        """Get the widget's callback with the provided plugin bound as its first argument.
+
+        Parameters
+        ----------
+        plugin : `Plugin`
+            The plugin to bind the callback to.
+
+        Returns
+        -------
+        `Callable[..., Any]`
+            The bound callback.
+        """
+        return functools.partial(self.callback, plugin)
 
     @property
     def name(self) -> str:
@@ -585,31 +695,37 @@ class BaseWidget(dynamicpy.BaseWidget[CallbackT]):
         return self.callback.__qualname__
 
 
-class _WidgetPluginMeta(type):
-    """Metaclass for injecting plugin registration into widgets."""
-
-    def __new__(mcls, name, bases, namespace):
-        cls = super().__new__(mcls, name, bases, namespace)
-        loader = dynamicpy.DynamicLoader()
-        loader.register_handler(cls._inject, lambda _, v: safesubclass(v, BaseWidget))
-        loader.load_object(cls)
-        return cls
+class WidgetPlugin(Plugin):
+    """Base class for wiget plugins, allowing for the creation of more complex widgets."""
 
-    def _inject(cls, _, widget) -> None:
+    __slots__ = ()
+
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        super().__init_subclass__(**kwargs)
+        # read the class dictionaries directly rather than building a sorted dir()
+        seen: set[str] = set()
+        for klass in cls.__mro__:
+            for name, value in vars(klass).items():
+                # Ignore Private and Built-In Attributes as well as overridden names
+                if name.startswith("_") or name in seen:
+                    continue
+                seen.add(name)
+                if safesubclass(value, BaseWidget):
+                    cls._inject(value)
+
+    @classmethod
+    def _inject(cls, widget: type[BaseWidget]) -> None:
         """Inject the plugin's registration method into the widget's registration method."""
 
         def proxy(widget, plugin: Plugin, client: Client) -> None:
-            if not client.has_plugin(cls):
+            widget_plugin = client._plugins.get(cls)
+            if widget_plugin is None:
                 # todo: protect against circular widget dependencies
                 client.register_plugin(cls)
-            widget_plugin = client.get_plugin(cls)  # type: ignore
+                widget_plugin = client._plugins[cls]
             cls.register(widget_plugin, widget, plugin)  # type: ignore
 
-        setattr(widget, "register", proxy)
-
-
-class WidgetPlugin(Plugin, metaclass=_WidgetPluginMeta):
-    """Base class for wiget plugins, allowing for the creation of more complex widgets."""
+        widget.register = proxy  # type: ignore
 
     def register(self, widget: BaseWidget, plugin: Plugin):
         """Register the provided widget with the client.
@@ -1,9 +1,9 @@
 __all__ = (
-    "PluginDependencyError",
+    "AmethystError",
     "DuplicatePluginError",
-    "RegisterPluginError",
     "ModuleLocateError",
-    "AmethystError",
+    "PluginDependencyError",
+    "RegisterPluginError",
 )
 
 
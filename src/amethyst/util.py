@@ -1,6 +1,6 @@
 from typing import Any
 
-__all__ = ("is_dict_subset", "classproperty")
+__all__ = ("classproperty", "is_dict_subset")
 
 
 def is_dict_subset(superset: dict[Any, Any], subset: dict[Any, Any]) -> bool:
@@ -24,18 +24,29 @@ def is_dict_subset(superset: dict[Any, Any], subset: dict[Any, Any]) -> bool:
 
 
 def _node_is_subset(superset: Any, subset: Any) -> bool:
-    if isinstance(superset, dict) and isinstance(subset, dict):
-        # Ensure that all items in the subset are present in the superset
-        return all(
-            k in superset and _node_is_subset(superset[k], v) for k, v in subset.items()
-        )
-
-    if isinstance(superset, list) and isinstance(subset, list):
-        # Ensure that the list contains items that are subsets of the supersets items
-        return len(superset) == len(subset) and all(
-            _node_is_subset(superset[i], y) for i, y in enumerate(subset)
-        )
-    return superset == subset
+    # Walk the nodes with an explicit stack rather than recursing into each one
+    stack = [(superset, subset)]
+    while stack:
+        superset, subset = stack.pop()
+        if superset is subset:
+            continue
+
+        if isinstance(superset, dict) and isinstance(subset, dict):
+            # Ensure that all items in the subset are present in the superset
+            for k, v in subset.items():
+                if k not in superset:
+                    return False
+                stack.append((superset[k], v))
+
+        elif isinstance(superset, list) and isinstance(subset, list):
+            # Ensure that the list contains items that are subsets of the supersets items
+            if len(superset) != len(subset):
+                return False
+            stack.extend(zip(superset, subset))
+
+        elif superset != subset:
+            return False
+    return True
 
 
 class classproperty:
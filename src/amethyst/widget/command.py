@@ -1,5 +1,6 @@
 import logging
-from typing import Any, Callable, Concatenate, Coroutine, Optional, ParamSpec
+from collections.abc import Callable, Coroutine
+from typing import Any, Concatenate, ParamSpec
 
 from discord import Interaction
 from discord.app_commands import Command
@@ -13,6 +14,18 @@ Callback = Callable[Concatenate[PluginSelf, Interaction, P], Coroutine[Any, Any,
 _log = logging.getLogger(__name__)
 
 
+def _describe(doc: str | None) -> str:
+    """Return the default command description for a callback's docstring."""
+    if doc is None:
+        return "..."
+    if "\n" not in doc:
+        # a single line that already fits needs no wrapping, only whitespace collapsing
+        description = " ".join(doc.split())
+        if len(description) <= 100:
+            return description
+    return _shorten(doc)
+
+
 class CommandWidget(BaseWidget[Callback[P]]):
     """Represents an Amethyst command.
 
@@ -22,24 +35,21 @@ class CommandWidget(BaseWidget[Callback[P]]):
     def __init__(
         self,
         callback: Callback,
-        name: Optional[str] = None,
-        description: Optional[str] = None,
+        name: str | None = None,
+        description: str | None = None,
         nsfw: bool = False,
     ) -> None:
         super().__init__(callback)  # type: ignore
+        if description is None:
+            # resolve the docstring fallback once rather than on every access
+            description = _describe(callback.__doc__)
         self._description = description
         self._name = name
         self.nsfw = nsfw
 
     @property
     def description(self) -> str:
-        if self._description is not None:
-            return self._description
-
-        if self.callback.__doc__ is None:
-            return "..."
-        else:
-            return _shorten(self.callback.__doc__)
+        return self._description
 
     def register(self, plugin: Plugin, client: Client) -> None:
         _log.debug("Registering command '%s'", self.name)
@@ -1,13 +1,25 @@
-from amethyst.widget.event import library
+import importlib
+from typing import TYPE_CHECKING, Any
+
 from amethyst.widget.event.event import (
     Event,
     EventWidget,
     event,
 )
 
+if TYPE_CHECKING:
+    from amethyst.widget.event import library
+
 __all__ = (
-    "library",
     "Event",
     "EventWidget",
     "event",
+    "library",
 )
+
+
+def __getattr__(name: str) -> Any:
+    # The event library is only built once it is first referenced
+    if name == "library":
+        return importlib.import_module(f"{__name__}.library")
+    raise AttributeError(f"module '{__name__}' has no attribute '{name}'")
@@ -1,11 +1,11 @@
 from __future__ import annotations
 
 import logging
+import sys
+from collections.abc import Callable, Coroutine
 from typing import (
     Any,
-    Callable,
     Concatenate,
-    Coroutine,
     Generic,
     ParamSpec,
     TypeVar,
@@ -33,17 +33,19 @@ class Event(Generic[P]):
 
     Example:
     ```
-    on_message: AmethystEvent[[discord.Message], Coroutine] = AmethystEvent("on_message")
+    on_message: Event[discord.Message] = Event("message", lambda x: x.guild)
     ```
     """
 
+    __slots__ = ("_guild", "_name")
+
     def __init__(
         self,
         name: str,
         guild: Callable[P, discord.Guild | int | None] | None = None,
     ) -> None:
         self._guild = guild or (lambda *_: None)
-        self._name = name
+        self._name = sys.intern(name)
 
     @property
     def name(self) -> str:
@@ -55,7 +57,7 @@ class Event(Generic[P]):
 
 
 class EventWidget(BaseWidget[Callback[P]]):
-    """Represents a event widget, consisting of a callback function and the `AmethystEvent` that its subscribed to.
+    """Represents a event widget, consisting of a callback function and the `Event` that its subscribed to.
 
     These are not usually created manually, instead they are created using the `amethyst.event` decorator.
     """
@@ -76,29 +78,34 @@ class EventWidget(BaseWidget[Callback[P]]):
             self.event.name,
         )
 
+        # To support anonymous events using Client.event
+        callback = self.callback if plugin is None else self.bound(plugin)
+
         if self.event.name == "setup_hook":
-            if plugin is None:
-                client._setup_hooks.append(self.callback)
-            else:
-                client._setup_hooks.append(lambda: self.callback(plugin))  # type: ignore
+            client._setup_hooks.append(callback)
             return
 
+        # resolve everything the handlers need up front as they run for every dispatch
+        name = self.name
+        get_guild = self.event.get_guild
+        guild_allowed = client.guild_allowed
+        create_task = client.create_task
+
         async def wrapper(*args) -> None:
             try:
-                await self.callback(*args)  # type: ignore
-            except Exception:
-                _log.error("Error handling '%s': ", self.name, exc_info=True)
+                await callback(*args)  # type: ignore
+            except Exception:  # noqa: BLE001
+                _log.error("Error handling '%s': ", name, exc_info=True)
 
         def handler(*args) -> bool:
-            guild = self.event.get_guild(*args)
-            if guild is None or client.guild_allowed(guild):
-                if plugin is not None:  # To support anonymous events using Client.event
-                    args = (plugin, *args)
-
-                client.create_task(wrapper(*args))
+            guild = get_guild(*args)
+            if guild is None or guild_allowed(guild):
+                create_task(wrapper(*args))
             else:
                 _log.debug(
-                    f"Skipping invokation of event '{self.name}' as guild '{guild}' is not allowed."
+                    "Skipping invokation of event '%s' as guild '%s' is not allowed.",
+                    name,
+                    guild,
                 )
             return False
 
@@ -1,5 +1,5 @@
 import datetime
-from typing import List, Sequence
+from collections.abc import Sequence
 
 import discord
 from discord import app_commands
@@ -71,6 +71,7 @@ __all__ = (
     "on_scheduled_event_update",
     "on_scheduled_event_user_add",
     "on_scheduled_event_user_remove",
+    "on_setup_hook",
     "on_socket_event_type",
     "on_socket_raw_receive",
     "on_socket_raw_send",
@@ -87,7 +88,6 @@ __all__ = (
     "on_user_update",
     "on_voice_state_update",
     "on_webhooks_update",
-    "on_setup_hook",
 )
 
 on_raw_app_command_permissions_update: Event[
@@ -115,7 +115,7 @@ command: Union[app_commands.Command, app_commands.ContextMenu]
 """
 
 on_automod_rule_create: Event[discord.AutoModRule] = Event(
-    "on_automod_rule_create", lambda x: x.guild
+    "automod_rule_create", lambda x: x.guild
 )
 """Called when a AutoModRule is created. You must have manage_guild to receive this.
 
@@ -128,7 +128,7 @@ rule: AutoModRule
 """
 
 on_automod_rule_update: Event[discord.AutoModRule] = Event(
-    "on_automod_rule_update", lambda x: x.guild
+    "automod_rule_update", lambda x: x.guild
 )
 """Called when a AutoModRule is updated. You must have manage_guild to receive this.
 
@@ -141,7 +141,7 @@ rule: AutoModRule
 """
 
 on_automod_rule_delete: Event[discord.AutoModRule] = Event(
-    "on_automod_rule_delete", lambda x: x.guild
+    "automod_rule_delete", lambda x: x.guild
 )
 """Called when a AutoModRule is deleted. You must have manage_guild to receive this.
 
@@ -165,7 +165,7 @@ execution: AutoModAction
 """
 
 on_guild_channel_delete: Event[discord.abc.GuildChannel] = Event(
-    "on_guild_channel_delete", lambda x: x.guild
+    "guild_channel_delete", lambda x: x.guild
 )
 """Called whenever a guild channel is deleted.
 
@@ -178,7 +178,7 @@ channel: abc.GuildChannel
 """
 
 on_guild_channel_create: Event[discord.abc.GuildChannel] = Event(
-    "on_guild_channel_create", lambda x: x.guild
+    "guild_channel_create", lambda x: x.guild
 )
 """Called whenever a guild channel is created.
 
@@ -190,9 +190,9 @@ channel: abc.GuildChannel
     The guild channel that got created.
 """
 
-on_guild_channel_update: Event[
-    [discord.abc.GuildChannel, discord.abc.GuildChannel]
-] = Event("guild_channel_update", lambda x, _: x.guild)
+on_guild_channel_update: Event[[discord.abc.GuildChannel, discord.abc.GuildChannel]] = (
+    Event("guild_channel_update", lambda x, _: x.guild)
+)
 """Called whenever a guild channel is updated. e.g. changed name, topic, permissions.
 
 This requires Intents.guilds to be enabled.
@@ -376,9 +376,7 @@ guild: Guild
     The guild that got removed.
 """
 
-on_guild_update: Event[discord.Guild, discord.Guild] = Event(
-    "on_guild_update", lambda x, _: x
-)
+on_guild_update: Event[discord.Guild, discord.Guild] = Event("guild_update", lambda x, _: x)
 """Called when a Guild updates, for example:
 - Changed name
 - Changed AFK channel
@@ -430,7 +428,7 @@ after: Sequence[GuildSticker]
 """
 
 on_audit_log_entry_create: Event[discord.AuditLogEntry] = Event(
-    "on_audit_log_entry_create", lambda x: x.guild
+    "audit_log_entry_create", lambda x: x.guild
 )
 """Called when a Guild gets a new audit log entry. You must have view_audit_log to receive this.
 
@@ -478,7 +476,7 @@ invite: Invite
 """
 
 on_integration_create: Event[discord.Integration] = Event(
-    "on_integration_create", lambda x: x.guild
+    "integration_create", lambda x: x.guild
 )
 """Called when an integration is created.
 
@@ -491,7 +489,7 @@ integration: Integration
 """
 
 on_integration_update: Event[discord.Integration] = Event(
-    "on_integration_update", lambda x: x.guild
+    "integration_update", lambda x: x.guild
 )
 """Called when an integration is updated.
 
@@ -504,7 +502,7 @@ integration: Integration
 """
 
 on_guild_integrations_update: Event[discord.Guild] = Event(
-    "on_guild_integrations_update", lambda x: x
+    "guild_integrations_update", lambda x: x
 )
 """Called whenever an integration is created, modified, or removed from a guild.
 
@@ -517,7 +515,7 @@ guild: Guild
 """
 
 on_webhooks_update: Event[discord.abc.GuildChannel] = Event(
-    "on_webhooks_update", lambda x: x.guild
+    "webhooks_update", lambda x: x.guild
 )
 """Called whenever a webhook is created, modified, or removed from a guild channel.
 
@@ -530,7 +528,7 @@ channel: abc.GuildChannel
 """
 
 on_raw_integration_delete: Event[discord.RawIntegrationDeleteEvent] = Event(
-    "on_raw_integration_delete", lambda x: x.guild_id
+    "raw_integration_delete", lambda x: x.guild_id
 )
 """Called when an integration is deleted.
 
@@ -583,7 +581,7 @@ member: Member
 """
 
 on_raw_member_remove: Event[discord.RawMemberRemoveEvent] = Event(
-    "on_raw_member_remove", lambda x: x.guild_id
+    "raw_member_remove", lambda x: x.guild_id
 )
 """Called when a Member leaves a Guild.
 
@@ -598,7 +596,7 @@ payload: RawMemberRemoveEvent
 """
 
 on_member_update: Event[discord.Member, discord.Member] = Event(
-    "on_member_update", lambda x, _: x.guild
+    "member_update", lambda x, _: x.guild
 )
 """Called when a Member updates their profile.
 
@@ -643,7 +641,7 @@ after: User
 """
 
 on_member_ban: Event[discord.Guild, discord.User | discord.Member] = Event(
-    "on_member_ban", lambda x, _: x
+    "member_ban", lambda x, _: x
 )
 """Called when a user gets banned from a Guild.
 
@@ -671,7 +669,7 @@ user: User
 """
 
 on_presence_update: Event[discord.Member, discord.Member] = Event(
-    "on_presence_update", lambda x, _: x.guild
+    "presence_update", lambda x, _: x.guild
 )
 """Called when a Member updates their presence.
 
@@ -707,7 +705,7 @@ message: Message
 """
 
 on_message_edit: Event[discord.Message, discord.Message] = Event(
-    "on_message_edit", lambda x, _: x.guild
+    "message_edit", lambda x, _: x.guild
 )
 """Called when a Message receives an update event.
 If the message is not found in the internal message cache, then these events will not be called.
@@ -746,8 +744,8 @@ message: Message
     The deleted message.
 """
 
-on_bulk_message_delete: Event[List[discord.Message]] = Event(
-    "on_bulk_message_delete", lambda x: x[0].guild
+on_bulk_message_delete: Event[list[discord.Message]] = Event(
+    "bulk_message_delete", lambda x: x[0].guild
 )
 """Called when messages are bulk deleted.
 If none of the messages deleted are found in the internal message cache, then this event will not be called.
@@ -760,12 +758,12 @@ This requires Intents.messages to be enabled.
 
 Parameters
 ----------
-messages: List[Message]
+messages: list[Message]
     The messages that have been deleted.
 """
 
 on_raw_message_edit: Event[discord.RawMessageUpdateEvent] = Event(
-    "on_raw_message_edit", lambda x: x.guild_id
+    "raw_message_edit", lambda x: x.guild_id
 )
 """Called when a message is edited. Unlike on_message_edit(), this is called regardless of the state of the internal message cache.
 
@@ -789,7 +787,7 @@ payload: RawMessageUpdateEvent
 """
 
 on_raw_message_delete: Event[discord.RawMessageDeleteEvent] = Event(
-    "on_raw_message_delete", lambda x: x.guild_id
+    "raw_message_delete", lambda x: x.guild_id
 )
 """Called when a message is deleted. Unlike on_message_delete(), this is called regardless of the message being in the internal message cache or not.
 
@@ -804,7 +802,7 @@ payload: RawMessageDeleteEvent
 """
 
 on_raw_bulk_message_delete: Event[discord.RawBulkMessageDeleteEvent] = Event(
-    "on_raw_bulk_message_delete", lambda x: x.guild_id
+    "raw_bulk_message_delete", lambda x: x.guild_id
 )
 """Called when a bulk delete is triggered. Unlike on_bulk_message_delete(), this is called regardless of the messages being in the internal message cache or not.
 
@@ -859,8 +857,8 @@ user: Member | User
     The user whose reaction was removed.
 """
 
-on_reaction_clear: Event[discord.Message, List[discord.Reaction]] = Event(
-    "on_reaction_clear", lambda x, _: x.guild
+on_reaction_clear: Event[discord.Message, list[discord.Reaction]] = Event(
+    "reaction_clear", lambda x, _: x.guild
 )
 """Called when a message has all its reactions removed from it.
 Similar to on_message_edit(), if the message is not found in the internal message cache,then this event will not be called. Consider using on_raw_reaction_clear() instead.
@@ -871,12 +869,12 @@ Parameters
 ----------
 message: Message
     The message that had its reactions cleared.
-reactions: List[Reaction]
+reactions: list[Reaction]
     The reactions that were removed.
 """
 
 on_reaction_clear_emoji: Event[discord.Reaction] = Event(
-    "on_reaction_clear_emoji", lambda x: x.message.guild
+    "reaction_clear_emoji", lambda x: x.message.guild
 )
 """Called when a message has a specific reaction removed from it.
 Similar to on_message_edit(), if the message is not found in the internal message cache,then this event will not be called. Consider using on_raw_reaction_clear_emoji() instead.
@@ -892,7 +890,7 @@ reaction: Reaction
 """
 
 on_raw_reaction_add: Event[discord.RawReactionActionEvent] = Event(
-    "on_raw_reaction_add", lambda x: x.guild_id
+    "raw_reaction_add", lambda x: x.guild_id
 )
 """Called when a message has a reaction added. Unlike on_reaction_add(), this is called regardless of the state of the internal message cache.
 
@@ -905,7 +903,7 @@ payload: RawReactionActionEvent
 """
 
 on_raw_reaction_remove: Event[discord.RawReactionActionEvent] = Event(
-    "on_raw_reaction_remove", lambda x: x.guild_id
+    "raw_reaction_remove", lambda x: x.guild_id
 )
 """Called when a message has a reaction removed. Unlike on_reaction_remove(), this is called regardless of the state of the internal message cache.
 
@@ -918,7 +916,7 @@ payload: RawReactionActionEvent
 """
 
 on_raw_reaction_clear: Event[discord.RawReactionClearEvent] = Event(
-    "on_raw_reaction_clear", lambda x: x.guild_id
+    "raw_reaction_clear", lambda x: x.guild_id
 )
 """Called when a message has all its reactions removed. Unlike on_reaction_clear(), this is called regardless of the state of the internal message cache.
 
@@ -970,7 +968,7 @@ role: Role
 """
 
 on_guild_role_update: Event[discord.Role, discord.Role] = Event(
-    "on_guild_role_update", lambda x, _: x.guild
+    "guild_role_update", lambda x, _: x.guild
 )
 """Called when a Role is changed guild-wide.
 
@@ -985,7 +983,7 @@ after: Role
 """
 
 on_scheduled_event_create: Event[discord.ScheduledEvent] = Event(
-    "on_scheduled_event_create", lambda x: x.guild
+    "scheduled_event_create", lambda x: x.guild
 )
 """Called when a ScheduledEvent is created.
 
@@ -998,7 +996,7 @@ event: ScheduledEvent
 """
 
 on_scheduled_event_delete: Event[discord.ScheduledEvent] = Event(
-    "on_scheduled_event_delete", lambda x: x.guild
+    "scheduled_event_delete", lambda x: x.guild
 )
 """Called when a ScheduledEvent is deleted.
 
@@ -1063,7 +1061,7 @@ user: User
 """
 
 on_stage_instance_create: Event[discord.StageInstance] = Event(
-    "on_stage_instance_create", lambda x: x.guild
+    "stage_instance_create", lambda x: x.guild
 )
 """Called when a StageInstance is created for a StageChannel.
 
@@ -1074,7 +1072,7 @@ stage_instance: StageInstance
 """
 
 on_stage_instance_delete: Event[discord.StageInstance] = Event(
-    "on_stage_instance_delete", lambda x: x.guild
+    "stage_instance_delete", lambda x: x.guild
 )
 """Called when a StageInstance is deleted for a StageChannel.
 
@@ -1128,7 +1126,7 @@ thread: Thread
 """
 
 on_thread_update: Event[discord.Thread, discord.Thread] = Event(
-    "on_thread_update", lambda x, _: x.guild
+    "thread_update", lambda x, _: x.guild
 )
 """Called whenever a thread is updated.
 
@@ -1178,7 +1176,7 @@ thread: Thread
 """
 
 on_raw_thread_update: Event[discord.RawThreadUpdateEvent] = Event(
-    "on_raw_thread_update", lambda x: x.guild_id
+    "raw_thread_update", lambda x: x.guild_id
 )
 """Called whenever a thread is updated. Unlike on_thread_update(), this is called regardless of the thread being in the internal thread cache or not.
 
@@ -1191,7 +1189,7 @@ payload: RawThreadUpdateEvent
 """
 
 on_raw_thread_delete: Event[discord.RawThreadDeleteEvent] = Event(
-    "on_raw_thread_delete", lambda x: x.guild_id
+    "raw_thread_delete", lambda x: x.guild_id
 )
 """Called whenever a thread is deleted. Unlike on_thread_delete(), this is called regardless of the thread being in the internal thread cache or not.
 
@@ -1204,7 +1202,7 @@ payload: RawThreadDeleteEvent
 """
 
 on_thread_member_join: Event[discord.ThreadMember] = Event(
-    "on_thread_member_join", lambda x: x.thread.guild
+    "thread_member_join", lambda x: x.thread.guild
 )
 """Called when a ThreadMember joins a Thread.
 
@@ -1219,7 +1217,7 @@ member: ThreadMember
 """
 
 on_thread_member_remove: Event[discord.ThreadMember] = Event(
-    "on_thread_member_remove", lambda x: x.thread.guild
+    "thread_member_remove", lambda x: x.thread.guild
 )
 """Called when a ThreadMember leaves a Thread.
 
@@ -1234,7 +1232,7 @@ member: ThreadMember
 """
 
 on_raw_thread_member_remove: Event[discord.RawThreadMembersUpdate] = Event(
-    "on_raw_thread_member_remove", lambda x: x.guild_id
+    "raw_thread_member_remove", lambda x: x.guild_id
 )
 """Called when a ThreadMember leaves a Thread. Unlike on_thread_member_remove(), this is called regardless of the member being in the internal thread's members cache or not.
 
@@ -1246,9 +1244,9 @@ payload: RawThreadMembersUpdate
     The raw event payload data.
 """
 
-on_voice_state_update: Event[
-    discord.Member, discord.VoiceState, discord.VoiceState
-] = Event("voice_state_update", lambda x, *_: x.guild)
+on_voice_state_update: Event[discord.Member, discord.VoiceState, discord.VoiceState] = (
+    Event("voice_state_update", lambda x, *_: x.guild)
+)
 """Called when a Member changes their VoiceState.
 
 The following, but not limited to, examples illustrate when this event is called:
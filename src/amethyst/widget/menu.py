@@ -1,12 +1,13 @@
 import inspect
 import logging
-from typing import Any, Callable, Coroutine, Optional, TypeVar, Union
+from collections.abc import Callable, Coroutine
+from typing import Any, TypeVar
 
 from discord import Interaction, Member, Message, User, app_commands
 
 from amethyst.amethyst import BaseWidget, Client, Plugin, PluginSelf
 
-SubjectT = TypeVar("SubjectT", Message, User, Member, Union[User, Member])
+SubjectT = TypeVar("SubjectT", Message, User, Member, User | Member)
 Callback = Callable[[PluginSelf, Interaction, SubjectT], Coroutine[Any, Any, None]]
 
 _log = logging.getLogger(__name__)
@@ -21,13 +22,24 @@ class ContextMenuWidget(BaseWidget[Callback[SubjectT]]):
     def __init__(
         self,
         callback: Callback,
-        name: Optional[str] = None,
+        name: str | None = None,
         nsfw: bool = False,
     ) -> None:
         super().__init__(callback)
         self._name = name
         self.nsfw = nsfw
 
+        # Resolve the subject type annotation once rather than on every registration
+        params = inspect.signature(callback).parameters
+        if len(params) != 3:
+            raise ValueError("Context menus require exactly 3 parameters")
+
+        *_, subject = params.values()
+        if subject.annotation is subject.empty:
+            raise ValueError("Third parameter of context menus must be explicitly typed.")
+
+        self._subject = subject.annotation
+
     def wrap(
         self,
         plugin: Plugin,
@@ -36,15 +48,7 @@ class ContextMenuWidget(BaseWidget[Callback[SubjectT]]):
             await self.callback(plugin, interaction, subject)
 
         # Copy subject type annotation
-        params = inspect.signature(self.callback).parameters
-        if len(params) != 3:
-            raise ValueError("Context menus require exactly 3 parameters")
-
-        *_, subject = params.values()
-        if subject.annotation is subject.empty:
-            raise ValueError("Third parameter of context menus must be explicitly typed.")
-
-        wrapped.__annotations__["subject"] = subject.annotation
+        wrapped.__annotations__["subject"] = self._subject
 
         return wrapped
 
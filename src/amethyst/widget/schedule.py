@@ -3,8 +3,10 @@ from __future__ import annotations
 import asyncio
 import itertools
 import logging
+import time
+from collections.abc import Callable, Coroutine, Iterator
 from datetime import datetime
-from typing import Any, Callable, Coroutine, Iterator
+from typing import Any
 
 from croniter import CroniterBadCronError, croniter
 
@@ -27,8 +29,10 @@ async def wait_until(when: datetime):
     when : datetime
         The datetime to wait until.
     """
+    # compare against the wall clock as a float timestamp to avoid datetime arithmetic
+    target = when.timestamp()
     while True:
-        delay = (when - datetime.now()).total_seconds()
+        delay = target - time.time()
         if delay <= _min_step:
             break
         await asyncio.sleep(delay / 2)
@@ -68,13 +72,20 @@ class ScheduleWidget(BaseWidget[Callback]):
     def register(self, plugin: Plugin, client: Client) -> None:
         _log.debug("Registering schedule '%s' with '%s'", self.name, self.cron)
 
+        async def invoke():
+            # the task is never awaited, so report failures instead of leaving them to gc
+            try:
+                await self.callback(plugin)
+            except Exception:  # noqa: BLE001
+                _log.error("Error invoking schedule '%s'", self.name, exc_info=True)
+
         async def loop():
             iter = self.get_iter()
             while not client.is_closed():
                 await wait_until(next(iter))
                 if client.is_ready():
                     _log.debug("Invoking schedule '%s'", self.name)
-                    client.create_task(self.callback(plugin))
+                    client.create_task(invoke())
                 else:
                     _log.debug("Skipping schedule '%s' as client is not ready", self.name)
 
@@ -0,0 +1,45 @@
+import asyncio
+import pathlib
+import re
+
+import discord
+import pytest
+
+import amethyst
+from amethyst.widget.event import library
+
+# setup_hook is called by the client directly rather than dispatched
+_undispatched = {"setup_hook"}
+
+
+def _dispatched_names() -> set[str]:
+    pattern = re.compile(r"dispatch\(\s*['\"](\w+)['\"]")
+    root = pathlib.Path(discord.__file__).parent
+    return {
+        name for file in root.rglob("*.py") for name in pattern.findall(file.read_text())
+    }
+
+
+def test_library_names_match_attributes():
+    for attribute in library.__all__:
+        assert getattr(library, attribute).name == attribute.removeprefix("on_")
+
+
+def test_library_names_are_dispatched_by_discord():
+    dispatched = _dispatched_names()
+    for attribute in library.__all__:
+        name = getattr(library, attribute).name
+        if name not in _undispatched:
+            assert name in dispatched, f"'{attribute}' is never dispatched as '{name}'"
+
+
+@pytest.mark.parametrize("event", [library.on_message_edit, library.on_member_join])
+def test_library_events_resolve_wait_for(event: amethyst.Event):
+    async def main():
+        async with amethyst.Client(discord.Intents.none()) as client:
+            waiter = asyncio.ensure_future(client.wait_for(event))
+            await asyncio.sleep(0)
+            client.dispatch(event.name, "payload")
+            assert await asyncio.wait_for(waiter, 1) == "payload"
+
+    asyncio.run(main())
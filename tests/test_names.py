@@ -0,0 +1,51 @@
+import amethyst
+
+
+def test_plugin_name_defaults_to_qualname():
+    class Parent(amethyst.Plugin):
+        pass
+
+    class Child(Parent):
+        pass
+
+    assert amethyst.Plugin.name == "Plugin"
+    assert Parent.name == Parent.__qualname__
+    assert Child.name == Child.__qualname__
+
+
+def test_plugin_name_is_inherited_when_set():
+    class Parent(amethyst.Plugin):
+        name = "Custom"
+
+    class Child(Parent):
+        pass
+
+    class Renamed(Child):
+        name = "Other"
+
+    assert Parent.name == "Custom"
+    assert Child.name == "Custom"
+    assert Renamed.name == "Other"
+
+
+def test_widget_type_defaults_to_qualname():
+    class Parent(amethyst.BaseWidget):
+        pass
+
+    class Child(Parent):
+        pass
+
+    assert amethyst.BaseWidget.type == "BaseWidget"
+    assert Parent.type == Parent.__qualname__
+    assert Child.type == Child.__qualname__
+
+
+def test_widget_type_is_inherited_when_set():
+    class Parent(amethyst.BaseWidget):
+        type = "Custom"
+
+    class Child(Parent):
+        pass
+
+    assert Parent.type == "Custom"
+    assert Child.type == "Custom"